@@ -1,11 +1,53 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import mmap
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+_SMALL_FILE_BYTES = 128 * 1024
+
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
+    if path.stat().st_size < _SMALL_FILE_BYTES:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
     with path.open("rb") as f:
+        try:
+            # Hash straight from the page cache: no read() calls, no bytes copies.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):
+            pass  # not mappable (e.g. special files or filesystems without mmap)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
+
+
+def sha256_files_many(paths: list[Path]) -> dict[Path, str]:
+    """Hash several files; returns {path: sha256 hex} in input order."""
+    return {p: sha256_file(p) for p in paths}
+
+
+def dumps_manifest(obj: Any) -> bytes:
+    """Serialize as sorted, 2-space-indented JSON (UTF-8 bytes).
+
+    The orjson and stdlib backends agree byte-for-byte only on str keys, strings,
+    bools, None, 64-bit ints and lists/dicts of those. Floats may be formatted
+    differently (1e16 vs 1e+16), and orjson rejects non-str keys and larger ints.
+    Bundle hashes are taken over the bytes actually written, so verification does
+    not depend on which backend wrote them; callers must not assume identical bytes
+    across installs.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
@@ -1,27 +1,57 @@
 from __future__ import annotations
 
+import hashlib
 import json
-import os
 import secrets
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
 
-from jsonschema import Draft202012Validator
-
-from omniforge.artifacts.manifest import sha256_file
+from omniforge.artifacts.manifest import dumps_manifest, sha256_file, sha256_files_many
+from omniforge.contracts._manifest_validator import validate as _validate_manifest
 from omniforge.lanes.sat_lane import placeholder_sat_executor
 
 
-def _load_schema(root: Path, rel: str) -> dict[str, Any]:
-    p = root / rel
-    return json.loads(p.read_text(encoding="utf-8"))
+# Everything in the demo manifest except run_id, timestamp_utc and outputs.result
+# is fixed, so it is serialized once here and the per-run values are spliced in.
+_DEMO_MANIFEST_SKELETON = {
+    "manifest_version": "0.2.0",
+    "run_id": "__RUN_ID__",
+    "timestamp_utc": "__TIMESTAMP_UTC__",
+    "lane": "sat",
+    "inputs": {"bench_suite": "sat.tiny", "case_id": "uf20-01.cnf"},
+    "candidate": {
+        "executor": "placeholder_sat_executor",
+        "genome": {"seed": 0, "notes": "v0.2-seed placeholder"},
+        "commandline": ["placeholder_solver", "--seed", "0"],
+    },
+    "outputs": {
+        "result": "__RESULT__",
+        "stdout_path": "stdout.txt",
+        "stderr_path": "stderr.txt",
+    },
+    "hashes_file": "hashes.json",
+}
+
+_DEMO_MANIFEST_TEMPLATE = (
+    dumps_manifest(_DEMO_MANIFEST_SKELETON)
+    .replace(b"%", b"%%")
+    .replace(b'"__RUN_ID__"', b"%(run_id)s")
+    .replace(b'"__TIMESTAMP_UTC__"', b"%(timestamp_utc)s")
+    .replace(b'"__RESULT__"', b"%(result)s")
+)
+
+
+def _json_str(value: str) -> bytes:
+    # Same backend as the template, so spliced values are encoded consistently with it.
+    return dumps_manifest(value)
 
 
 def create_demo_run_bundle(root: Path) -> str:
     """Create a minimal run bundle under artifacts/ and validate its manifest."""
-    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + "-" + secrets.token_hex(4)
+    now = datetime.now(timezone.utc)
+    run_id = now.strftime("%Y%m%dT%H%M%SZ") + "-" + secrets.token_hex(4)
+    timestamp_utc = now.strftime("%Y-%m-%dT%H:%M:%SZ")
     out_dir = root / "artifacts" / f"run_{run_id}"
     out_dir.mkdir(parents=True, exist_ok=False)
 
@@ -33,66 +63,88 @@ def create_demo_run_bundle(root: Path) -> str:
     stderr_path.write_text(stderr, encoding="utf-8")
 
     manifest = {
-        "manifest_version": "0.2.0",
+        **_DEMO_MANIFEST_SKELETON,
         "run_id": run_id,
-        "timestamp_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "lane": "sat",
-        "inputs": {"bench_suite": "sat.tiny", "case_id": "uf20-01.cnf"},
-        "candidate": {
-            "executor": "placeholder_sat_executor",
-            "genome": {"seed": 0, "notes": "v0.2-seed placeholder"},
-            "commandline": ["placeholder_solver", "--seed", "0"],
-        },
-        "outputs": {
-            "result": result,
-            "stdout_path": "stdout.txt",
-            "stderr_path": "stderr.txt",
-        },
-        "hashes": {}
+        "timestamp_utc": timestamp_utc,
+        "outputs": {**_DEMO_MANIFEST_SKELETON["outputs"], "result": result},
     }
+    _validate_manifest(manifest)
 
-    manifest_path = out_dir / "manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
-
-    hashes = {
-        "stdout.txt": sha256_file(stdout_path),
-        "stderr.txt": sha256_file(stderr_path),
-        "manifest.json": sha256_file(manifest_path),
+    data = _DEMO_MANIFEST_TEMPLATE % {
+        b"run_id": _json_str(run_id),
+        b"timestamp_utc": _json_str(timestamp_utc),
+        b"result": _json_str(result),
     }
+    (out_dir / "manifest.json").write_bytes(data)
 
-    manifest["hashes"] = hashes
-    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
-
-    # Validate manifest
-    schema = _load_schema(root, "omniforge/contracts/artifact_manifest.schema.json")
-    Draft202012Validator.check_schema(schema)
-    Draft202012Validator(schema).validate(manifest)
+    # Hashes live in a sidecar, so the manifest is written once and is itself covered;
+    # its hash comes from the bytes in hand rather than a re-read.
+    digests = sha256_files_many([stdout_path, stderr_path])
+    hashes = {p.relative_to(out_dir).as_posix(): hx for p, hx in digests.items()}
+    hashes["manifest.json"] = hashlib.sha256(data).hexdigest()
+    (out_dir / "hashes.json").write_bytes(dumps_manifest(hashes))
 
     return run_id
 
 
+def _check_hash(run_dir: Path, rel: str, exp: str) -> str | None:
+    """Return a failure detail for one bundle file, or None if it verifies."""
+    p = run_dir / rel
+    # Entries come from the bundle itself; never hash files outside run_dir.
+    if not p.resolve().is_relative_to(run_dir.resolve()):
+        return f"invalid path: {rel}"
+    if not p.exists():
+        return f"missing: {rel}"
+    if not p.is_file():
+        return f"invalid path: {rel}"
+    got = sha256_file(p)
+    if got != exp:
+        return f"mismatch: {rel} expected={exp} got={got}"
+    return None
+
+
 def verify_run_bundle_hashes(root: Path, run_id: str) -> tuple[bool, str]:
     run_dir = root / "artifacts" / f"run_{run_id}"
     manifest_path = run_dir / "manifest.json"
     if not manifest_path.exists():
         return False, f"manifest not found: {manifest_path}"
 
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-    expected = manifest.get("hashes", {})
+    manifest = json.loads(manifest_path.read_bytes())
+    hashes_file = manifest.get("hashes_file")
+    if hashes_file is not None:
+        hashes_path = run_dir / hashes_file if isinstance(hashes_file, str) else None
+        # Verification must stay inside the bundle: no absolute or ".." paths out of run_dir.
+        if hashes_path is None or not hashes_path.resolve().is_relative_to(run_dir.resolve()):
+            return False, "invalid hashes_file"
+        if not hashes_path.exists():
+            return False, f"hashes file not found: {hashes_path}"
+        if not hashes_path.is_file():
+            return False, "invalid hashes_file"
+        expected = json.loads(hashes_path.read_bytes())
+        if not isinstance(expected, dict):
+            return False, "invalid hashes field"
+        # The sidecar does not hash itself, so an emptied or trimmed copy must not pass:
+        # the manifest and the outputs it names are always required.
+        outputs = manifest.get("outputs")
+        if not isinstance(outputs, dict):
+            return False, "invalid outputs field"
+        required = ["manifest.json", outputs.get("stdout_path"), outputs.get("stderr_path")]
+        if not all(isinstance(rel, str) for rel in required):
+            return False, "invalid outputs field"
+        unhashed = [f"unhashed: {rel}" for rel in required if rel not in expected]
+        if unhashed:
+            return False, "\n".join(unhashed)
+    else:
+        # Bundles written before hashes.json embed the hashes in the manifest.
+        expected = manifest.get("hashes", {})
     if not isinstance(expected, dict):
         return False, "invalid hashes field"
 
-    details = []
-    ok = True
-    for rel, exp in expected.items():
-        p = run_dir / rel
-        if not p.exists():
-            ok = False
-            details.append(f"missing: {rel}")
-            continue
-        got = sha256_file(p)
-        if got != exp:
-            ok = False
-            details.append(f"mismatch: {rel} expected={exp} got={got}")
-
-    return ok, "\n".join(details)
+    items = sorted(expected.items())
+    if not items:
+        return True, ""
+    # hashlib releases the GIL while hashing, so threads overlap I/O and digesting.
+    with ThreadPoolExecutor(max_workers=min(8, len(items))) as ex:
+        details = [d for d in ex.map(lambda kv: _check_hash(run_dir, *kv), items) if d is not None]
+
+    return not details, "\n".join(details)
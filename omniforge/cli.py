@@ -26,8 +26,8 @@ def cmd_reproduce(args: argparse.Namespace) -> int:
     return 2
 
 
-def cmd_validate_contracts(_: argparse.Namespace) -> int:
-    validate_contracts(root=Path.cwd())
+def cmd_validate_contracts(args: argparse.Namespace) -> int:
+    validate_contracts(root=Path.cwd(), strict=args.strict)
     print("OK: contracts validated")
     return 0
 
@@ -44,6 +44,7 @@ def build_parser() -> argparse.ArgumentParser:
     r.set_defaults(func=cmd_reproduce)
 
     v = sub.add_parser("validate-contracts", help="Validate JSON schemas and sample instances")
+    v.add_argument("--strict", action="store_true", help="Also check the schemas against the Draft 2020-12 metaschema")
     v.set_defaults(func=cmd_validate_contracts)
 
     return p
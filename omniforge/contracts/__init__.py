@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
-from jsonschema import Draft202012Validator
+from omniforge.contracts._eval_validator import validate as _validate_eval_contract
+from omniforge.contracts._loader import load_schema
+from omniforge.contracts._manifest_validator import validate as _validate_manifest
 
 
-def _load_schema(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+def validate_contracts(root: Path, strict: bool = False) -> None:
+    if strict:
+        # jsonschema is only needed for this check; importing it lazily keeps it off
+        # the demo/reproduce startup path.
+        from jsonschema import Draft202012Validator
 
-
-def validate_contracts(root: Path) -> None:
-    contracts_dir = root / "omniforge" / "contracts"
-    eval_schema = _load_schema(contracts_dir / "eval_contract.schema.json")
-    art_schema = _load_schema(contracts_dir / "artifact_manifest.schema.json")
-
-    # Ensure schemas are themselves valid Draft 2020-12 schemas
-    Draft202012Validator.check_schema(eval_schema)
-    Draft202012Validator.check_schema(art_schema)
+        # Ensure schemas are themselves valid Draft 2020-12 schemas
+        contracts_dir = root / "omniforge" / "contracts"
+        eval_schema = load_schema(str(contracts_dir / "eval_contract.schema.json"))
+        art_schema = load_schema(str(contracts_dir / "artifact_manifest.schema.json"))
+        Draft202012Validator.check_schema(eval_schema)
+        Draft202012Validator.check_schema(art_schema)
 
     # Validate sample instances
     sample_eval = {
@@ -33,7 +34,7 @@ def validate_contracts(root: Path) -> None:
             "proof_checker": "placeholder"
         },
     }
-    Draft202012Validator(eval_schema).validate(sample_eval)
+    _validate_eval_contract(sample_eval)
 
     sample_manifest = {
         "manifest_version": "0.2.0",
@@ -43,6 +44,11 @@ def validate_contracts(root: Path) -> None:
         "inputs": {"bench_suite": "sat.tiny", "case_id": "uf20-01.cnf"},
         "candidate": {"executor": "placeholder", "genome": {"example": 1}, "commandline": ["solver", "--flag"]},
         "outputs": {"result": "UNKNOWN", "stdout_path": "stdout.txt", "stderr_path": "stderr.txt"},
-        "hashes": {"stdout.txt": "0"*64, "stderr.txt": "0"*64, "manifest.json": "0"*64}
+        "hashes_file": "hashes.json"
     }
-    Draft202012Validator(art_schema).validate(sample_manifest)
+    _validate_manifest(sample_manifest)
+
+    if strict:
+        # Cross-check the generated validators against the reference implementation
+        Draft202012Validator(eval_schema).validate(sample_eval)
+        Draft202012Validator(art_schema).validate(sample_manifest)
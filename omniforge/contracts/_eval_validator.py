@@ -0,0 +1,198 @@
+# Generated by scripts/generate_validators.py from eval_contract.schema.json; do not edit.
+# fmt: off
+SCHEMA = {'$schema': 'https://json-schema.org/draft/2020-12/schema',
+ 'title': 'EvalContract',
+ 'type': 'object',
+ 'required': ['version',
+              'lane',
+              'benchmarks',
+              'resources',
+              'determinism',
+              'evidence_requirements'],
+ 'properties': {'version': {'type': 'string'},
+                'lane': {'type': 'string', 'enum': ['sat', 'correctness']},
+                'benchmarks': {'type': 'object',
+                               'required': ['suite_id', 'cases'],
+                               'properties': {'suite_id': {'type': 'string'},
+                                              'cases': {'type': 'array',
+                                                        'items': {'type': 'string'},
+                                                        'minItems': 1}}},
+                'resources': {'type': 'object',
+                              'required': ['cpu_seconds',
+                                           'memory_mb',
+                                           'wall_seconds'],
+                              'properties': {'cpu_seconds': {'type': 'integer',
+                                                             'minimum': 1},
+                                             'memory_mb': {'type': 'integer',
+                                                           'minimum': 64},
+                                             'wall_seconds': {'type': 'integer',
+                                                              'minimum': 1}}},
+                'determinism': {'type': 'object',
+                                'required': ['seed', 'threads', 'env_locked'],
+                                'properties': {'seed': {'type': 'integer'},
+                                               'threads': {'type': 'integer',
+                                                           'minimum': 1},
+                                               'env_locked': {'type': 'boolean'}}},
+                'evidence_requirements': {'type': 'object',
+                                          'required': ['require_artifacts',
+                                                       'require_hash_manifest'],
+                                          'properties': {'require_artifacts': {'type': 'boolean'},
+                                                         'require_hash_manifest': {'type': 'boolean'},
+                                                         'unsat_requires_proof': {'type': 'boolean',
+                                                                                  'default': True},
+                                                         'proof_checker': {'type': 'string'}}}}}
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'EvalContract', 'type': 'object', 'required': ['version', 'lane', 'benchmarks', 'resources', 'determinism', 'evidence_requirements'], 'properties': {'version': {'type': 'string'}, 'lane': {'type': 'string', 'enum': ['sat', 'correctness']}, 'benchmarks': {'type': 'object', 'required': ['suite_id', 'cases'], 'properties': {'suite_id': {'type': 'string'}, 'cases': {'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}}}, 'resources': {'type': 'object', 'required': ['cpu_seconds', 'memory_mb', 'wall_seconds'], 'properties': {'cpu_seconds': {'type': 'integer', 'minimum': 1}, 'memory_mb': {'type': 'integer', 'minimum': 64}, 'wall_seconds': {'type': 'integer', 'minimum': 1}}}, 'determinism': {'type': 'object', 'required': ['seed', 'threads', 'env_locked'], 'properties': {'seed': {'type': 'integer'}, 'threads': {'type': 'integer', 'minimum': 1}, 'env_locked': {'type': 'boolean'}}}, 'evidence_requirements': {'type': 'object', 'required': ['require_artifacts', 'require_hash_manifest'], 'properties': {'require_artifacts': {'type': 'boolean'}, 'require_hash_manifest': {'type': 'boolean'}, 'unsat_requires_proof': {'type': 'boolean', 'default': True}, 'proof_checker': {'type': 'string'}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['version', 'lane', 'benchmarks', 'resources', 'determinism', 'evidence_requirements']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'EvalContract', 'type': 'object', 'required': ['version', 'lane', 'benchmarks', 'resources', 'determinism', 'evidence_requirements'], 'properties': {'version': {'type': 'string'}, 'lane': {'type': 'string', 'enum': ['sat', 'correctness']}, 'benchmarks': {'type': 'object', 'required': ['suite_id', 'cases'], 'properties': {'suite_id': {'type': 'string'}, 'cases': {'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}}}, 'resources': {'type': 'object', 'required': ['cpu_seconds', 'memory_mb', 'wall_seconds'], 'properties': {'cpu_seconds': {'type': 'integer', 'minimum': 1}, 'memory_mb': {'type': 'integer', 'minimum': 64}, 'wall_seconds': {'type': 'integer', 'minimum': 1}}}, 'determinism': {'type': 'object', 'required': ['seed', 'threads', 'env_locked'], 'properties': {'seed': {'type': 'integer'}, 'threads': {'type': 'integer', 'minimum': 1}, 'env_locked': {'type': 'boolean'}}}, 'evidence_requirements': {'type': 'object', 'required': ['require_artifacts', 'require_hash_manifest'], 'properties': {'require_artifacts': {'type': 'boolean'}, 'require_hash_manifest': {'type': 'boolean'}, 'unsat_requires_proof': {'type': 'boolean', 'default': True}, 'proof_checker': {'type': 'string'}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "version" in data_keys:
+            data_keys.remove("version")
+            data__version = data["version"]
+            if not isinstance(data__version, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".version must be string", value=data__version, name="" + (name_prefix or "data") + ".version", definition={'type': 'string'}, rule='type')
+        if "lane" in data_keys:
+            data_keys.remove("lane")
+            data__lane = data["lane"]
+            if not isinstance(data__lane, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lane must be string", value=data__lane, name="" + (name_prefix or "data") + ".lane", definition={'type': 'string', 'enum': ['sat', 'correctness']}, rule='type')
+            if not (isinstance(data__lane, str) and data__lane == 'sat' or isinstance(data__lane, str) and data__lane == 'correctness'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lane must be one of ['sat', 'correctness']", value=data__lane, name="" + (name_prefix or "data") + ".lane", definition={'type': 'string', 'enum': ['sat', 'correctness']}, rule='enum')
+        if "benchmarks" in data_keys:
+            data_keys.remove("benchmarks")
+            data__benchmarks = data["benchmarks"]
+            if not isinstance(data__benchmarks, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".benchmarks must be object", value=data__benchmarks, name="" + (name_prefix or "data") + ".benchmarks", definition={'type': 'object', 'required': ['suite_id', 'cases'], 'properties': {'suite_id': {'type': 'string'}, 'cases': {'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}}}, rule='type')
+            data__benchmarks_is_dict = isinstance(data__benchmarks, dict)
+            if data__benchmarks_is_dict:
+                data__benchmarks__missing_keys = set(['suite_id', 'cases']) - data__benchmarks.keys()
+                if data__benchmarks__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".benchmarks must contain " + (str(sorted(data__benchmarks__missing_keys)) + " properties"), value=data__benchmarks, name="" + (name_prefix or "data") + ".benchmarks", definition={'type': 'object', 'required': ['suite_id', 'cases'], 'properties': {'suite_id': {'type': 'string'}, 'cases': {'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}}}, rule='required')
+                data__benchmarks_keys = set(data__benchmarks.keys())
+                if "suite_id" in data__benchmarks_keys:
+                    data__benchmarks_keys.remove("suite_id")
+                    data__benchmarks__suiteid = data__benchmarks["suite_id"]
+                    if not isinstance(data__benchmarks__suiteid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".benchmarks.suite_id must be string", value=data__benchmarks__suiteid, name="" + (name_prefix or "data") + ".benchmarks.suite_id", definition={'type': 'string'}, rule='type')
+                if "cases" in data__benchmarks_keys:
+                    data__benchmarks_keys.remove("cases")
+                    data__benchmarks__cases = data__benchmarks["cases"]
+                    if not isinstance(data__benchmarks__cases, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".benchmarks.cases must be array", value=data__benchmarks__cases, name="" + (name_prefix or "data") + ".benchmarks.cases", definition={'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}, rule='type')
+                    data__benchmarks__cases_is_list = isinstance(data__benchmarks__cases, (list, tuple))
+                    if data__benchmarks__cases_is_list:
+                        data__benchmarks__cases_len = len(data__benchmarks__cases)
+                        if data__benchmarks__cases_len < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".benchmarks.cases must contain at least 1 items", value=data__benchmarks__cases, name="" + (name_prefix or "data") + ".benchmarks.cases", definition={'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}, rule='minItems')
+                        for data__benchmarks__cases_x, data__benchmarks__cases_item in enumerate(data__benchmarks__cases):
+                            if not isinstance(data__benchmarks__cases_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".benchmarks.cases[{data__benchmarks__cases_x}]".format(**locals()) + " must be string", value=data__benchmarks__cases_item, name="" + (name_prefix or "data") + ".benchmarks.cases[{data__benchmarks__cases_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "resources" in data_keys:
+            data_keys.remove("resources")
+            data__resources = data["resources"]
+            if not isinstance(data__resources, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources must be object", value=data__resources, name="" + (name_prefix or "data") + ".resources", definition={'type': 'object', 'required': ['cpu_seconds', 'memory_mb', 'wall_seconds'], 'properties': {'cpu_seconds': {'type': 'integer', 'minimum': 1}, 'memory_mb': {'type': 'integer', 'minimum': 64}, 'wall_seconds': {'type': 'integer', 'minimum': 1}}}, rule='type')
+            data__resources_is_dict = isinstance(data__resources, dict)
+            if data__resources_is_dict:
+                data__resources__missing_keys = set(['cpu_seconds', 'memory_mb', 'wall_seconds']) - data__resources.keys()
+                if data__resources__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources must contain " + (str(sorted(data__resources__missing_keys)) + " properties"), value=data__resources, name="" + (name_prefix or "data") + ".resources", definition={'type': 'object', 'required': ['cpu_seconds', 'memory_mb', 'wall_seconds'], 'properties': {'cpu_seconds': {'type': 'integer', 'minimum': 1}, 'memory_mb': {'type': 'integer', 'minimum': 64}, 'wall_seconds': {'type': 'integer', 'minimum': 1}}}, rule='required')
+                data__resources_keys = set(data__resources.keys())
+                if "cpu_seconds" in data__resources_keys:
+                    data__resources_keys.remove("cpu_seconds")
+                    data__resources__cpuseconds = data__resources["cpu_seconds"]
+                    if not isinstance(data__resources__cpuseconds, (int)) and not (isinstance(data__resources__cpuseconds, float) and data__resources__cpuseconds.is_integer()) or isinstance(data__resources__cpuseconds, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources.cpu_seconds must be integer", value=data__resources__cpuseconds, name="" + (name_prefix or "data") + ".resources.cpu_seconds", definition={'type': 'integer', 'minimum': 1}, rule='type')
+                    if isinstance(data__resources__cpuseconds, (int, float, Decimal)):
+                        if data__resources__cpuseconds < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources.cpu_seconds must be bigger than or equal to 1", value=data__resources__cpuseconds, name="" + (name_prefix or "data") + ".resources.cpu_seconds", definition={'type': 'integer', 'minimum': 1}, rule='minimum')
+                if "memory_mb" in data__resources_keys:
+                    data__resources_keys.remove("memory_mb")
+                    data__resources__memorymb = data__resources["memory_mb"]
+                    if not isinstance(data__resources__memorymb, (int)) and not (isinstance(data__resources__memorymb, float) and data__resources__memorymb.is_integer()) or isinstance(data__resources__memorymb, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources.memory_mb must be integer", value=data__resources__memorymb, name="" + (name_prefix or "data") + ".resources.memory_mb", definition={'type': 'integer', 'minimum': 64}, rule='type')
+                    if isinstance(data__resources__memorymb, (int, float, Decimal)):
+                        if data__resources__memorymb < 64:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources.memory_mb must be bigger than or equal to 64", value=data__resources__memorymb, name="" + (name_prefix or "data") + ".resources.memory_mb", definition={'type': 'integer', 'minimum': 64}, rule='minimum')
+                if "wall_seconds" in data__resources_keys:
+                    data__resources_keys.remove("wall_seconds")
+                    data__resources__wallseconds = data__resources["wall_seconds"]
+                    if not isinstance(data__resources__wallseconds, (int)) and not (isinstance(data__resources__wallseconds, float) and data__resources__wallseconds.is_integer()) or isinstance(data__resources__wallseconds, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources.wall_seconds must be integer", value=data__resources__wallseconds, name="" + (name_prefix or "data") + ".resources.wall_seconds", definition={'type': 'integer', 'minimum': 1}, rule='type')
+                    if isinstance(data__resources__wallseconds, (int, float, Decimal)):
+                        if data__resources__wallseconds < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".resources.wall_seconds must be bigger than or equal to 1", value=data__resources__wallseconds, name="" + (name_prefix or "data") + ".resources.wall_seconds", definition={'type': 'integer', 'minimum': 1}, rule='minimum')
+        if "determinism" in data_keys:
+            data_keys.remove("determinism")
+            data__determinism = data["determinism"]
+            if not isinstance(data__determinism, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".determinism must be object", value=data__determinism, name="" + (name_prefix or "data") + ".determinism", definition={'type': 'object', 'required': ['seed', 'threads', 'env_locked'], 'properties': {'seed': {'type': 'integer'}, 'threads': {'type': 'integer', 'minimum': 1}, 'env_locked': {'type': 'boolean'}}}, rule='type')
+            data__determinism_is_dict = isinstance(data__determinism, dict)
+            if data__determinism_is_dict:
+                data__determinism__missing_keys = set(['seed', 'threads', 'env_locked']) - data__determinism.keys()
+                if data__determinism__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".determinism must contain " + (str(sorted(data__determinism__missing_keys)) + " properties"), value=data__determinism, name="" + (name_prefix or "data") + ".determinism", definition={'type': 'object', 'required': ['seed', 'threads', 'env_locked'], 'properties': {'seed': {'type': 'integer'}, 'threads': {'type': 'integer', 'minimum': 1}, 'env_locked': {'type': 'boolean'}}}, rule='required')
+                data__determinism_keys = set(data__determinism.keys())
+                if "seed" in data__determinism_keys:
+                    data__determinism_keys.remove("seed")
+                    data__determinism__seed = data__determinism["seed"]
+                    if not isinstance(data__determinism__seed, (int)) and not (isinstance(data__determinism__seed, float) and data__determinism__seed.is_integer()) or isinstance(data__determinism__seed, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".determinism.seed must be integer", value=data__determinism__seed, name="" + (name_prefix or "data") + ".determinism.seed", definition={'type': 'integer'}, rule='type')
+                if "threads" in data__determinism_keys:
+                    data__determinism_keys.remove("threads")
+                    data__determinism__threads = data__determinism["threads"]
+                    if not isinstance(data__determinism__threads, (int)) and not (isinstance(data__determinism__threads, float) and data__determinism__threads.is_integer()) or isinstance(data__determinism__threads, bool):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".determinism.threads must be integer", value=data__determinism__threads, name="" + (name_prefix or "data") + ".determinism.threads", definition={'type': 'integer', 'minimum': 1}, rule='type')
+                    if isinstance(data__determinism__threads, (int, float, Decimal)):
+                        if data__determinism__threads < 1:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".determinism.threads must be bigger than or equal to 1", value=data__determinism__threads, name="" + (name_prefix or "data") + ".determinism.threads", definition={'type': 'integer', 'minimum': 1}, rule='minimum')
+                if "env_locked" in data__determinism_keys:
+                    data__determinism_keys.remove("env_locked")
+                    data__determinism__envlocked = data__determinism["env_locked"]
+                    if not isinstance(data__determinism__envlocked, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".determinism.env_locked must be boolean", value=data__determinism__envlocked, name="" + (name_prefix or "data") + ".determinism.env_locked", definition={'type': 'boolean'}, rule='type')
+        if "evidence_requirements" in data_keys:
+            data_keys.remove("evidence_requirements")
+            data__evidencerequirements = data["evidence_requirements"]
+            if not isinstance(data__evidencerequirements, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".evidence_requirements must be object", value=data__evidencerequirements, name="" + (name_prefix or "data") + ".evidence_requirements", definition={'type': 'object', 'required': ['require_artifacts', 'require_hash_manifest'], 'properties': {'require_artifacts': {'type': 'boolean'}, 'require_hash_manifest': {'type': 'boolean'}, 'unsat_requires_proof': {'type': 'boolean', 'default': True}, 'proof_checker': {'type': 'string'}}}, rule='type')
+            data__evidencerequirements_is_dict = isinstance(data__evidencerequirements, dict)
+            if data__evidencerequirements_is_dict:
+                data__evidencerequirements__missing_keys = set(['require_artifacts', 'require_hash_manifest']) - data__evidencerequirements.keys()
+                if data__evidencerequirements__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".evidence_requirements must contain " + (str(sorted(data__evidencerequirements__missing_keys)) + " properties"), value=data__evidencerequirements, name="" + (name_prefix or "data") + ".evidence_requirements", definition={'type': 'object', 'required': ['require_artifacts', 'require_hash_manifest'], 'properties': {'require_artifacts': {'type': 'boolean'}, 'require_hash_manifest': {'type': 'boolean'}, 'unsat_requires_proof': {'type': 'boolean', 'default': True}, 'proof_checker': {'type': 'string'}}}, rule='required')
+                data__evidencerequirements_keys = set(data__evidencerequirements.keys())
+                if "require_artifacts" in data__evidencerequirements_keys:
+                    data__evidencerequirements_keys.remove("require_artifacts")
+                    data__evidencerequirements__requireartifacts = data__evidencerequirements["require_artifacts"]
+                    if not isinstance(data__evidencerequirements__requireartifacts, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".evidence_requirements.require_artifacts must be boolean", value=data__evidencerequirements__requireartifacts, name="" + (name_prefix or "data") + ".evidence_requirements.require_artifacts", definition={'type': 'boolean'}, rule='type')
+                if "require_hash_manifest" in data__evidencerequirements_keys:
+                    data__evidencerequirements_keys.remove("require_hash_manifest")
+                    data__evidencerequirements__requirehashmanifest = data__evidencerequirements["require_hash_manifest"]
+                    if not isinstance(data__evidencerequirements__requirehashmanifest, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".evidence_requirements.require_hash_manifest must be boolean", value=data__evidencerequirements__requirehashmanifest, name="" + (name_prefix or "data") + ".evidence_requirements.require_hash_manifest", definition={'type': 'boolean'}, rule='type')
+                if "unsat_requires_proof" in data__evidencerequirements_keys:
+                    data__evidencerequirements_keys.remove("unsat_requires_proof")
+                    data__evidencerequirements__unsatrequiresproof = data__evidencerequirements["unsat_requires_proof"]
+                    if not isinstance(data__evidencerequirements__unsatrequiresproof, (bool)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".evidence_requirements.unsat_requires_proof must be boolean", value=data__evidencerequirements__unsatrequiresproof, name="" + (name_prefix or "data") + ".evidence_requirements.unsat_requires_proof", definition={'type': 'boolean', 'default': True}, rule='type')
+                else: data__evidencerequirements["unsat_requires_proof"] = True
+                if "proof_checker" in data__evidencerequirements_keys:
+                    data__evidencerequirements_keys.remove("proof_checker")
+                    data__evidencerequirements__proofchecker = data__evidencerequirements["proof_checker"]
+                    if not isinstance(data__evidencerequirements__proofchecker, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".evidence_requirements.proof_checker must be string", value=data__evidencerequirements__proofchecker, name="" + (name_prefix or "data") + ".evidence_requirements.proof_checker", definition={'type': 'string'}, rule='type')
+    return data
\ No newline at end of file
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: str) -> dict[str, Any]:
+    """Parse a schema file once per process. Callers must not mutate the result."""
+    return json.loads(Path(path).read_bytes())
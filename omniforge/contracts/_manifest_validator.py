@@ -0,0 +1,211 @@
+# Generated by scripts/generate_validators.py from artifact_manifest.schema.json; do not edit.
+# fmt: off
+SCHEMA = {'$schema': 'https://json-schema.org/draft/2020-12/schema',
+ 'title': 'ArtifactManifest',
+ 'type': 'object',
+ 'required': ['manifest_version',
+              'run_id',
+              'timestamp_utc',
+              'lane',
+              'inputs',
+              'candidate',
+              'outputs'],
+ 'anyOf': [{'required': ['hashes_file']}, {'required': ['hashes']}],
+ 'properties': {'manifest_version': {'type': 'string'},
+                'run_id': {'type': 'string'},
+                'timestamp_utc': {'type': 'string'},
+                'lane': {'type': 'string'},
+                'inputs': {'type': 'object',
+                           'required': ['bench_suite', 'case_id'],
+                           'properties': {'bench_suite': {'type': 'string'},
+                                          'case_id': {'type': 'string'}}},
+                'candidate': {'type': 'object',
+                              'required': ['executor', 'genome', 'commandline'],
+                              'properties': {'executor': {'type': 'string'},
+                                             'genome': {'type': 'object'},
+                                             'commandline': {'type': 'array',
+                                                             'items': {'type': 'string'}}}},
+                'outputs': {'type': 'object',
+                            'required': ['result',
+                                         'stdout_path',
+                                         'stderr_path'],
+                            'properties': {'result': {'type': 'string',
+                                                      'enum': ['SAT',
+                                                               'UNSAT',
+                                                               'UNKNOWN',
+                                                               'ERROR',
+                                                               'TIMEOUT']},
+                                           'stdout_path': {'type': 'string'},
+                                           'stderr_path': {'type': 'string'},
+                                           'proof_path': {'type': 'string'}}},
+                'hashes_file': {'type': 'string',
+                                'description': 'bundle-relative path of a JSON '
+                                               'object mapping file paths to '
+                                               'sha256 hex'},
+                'hashes': {'type': 'object',
+                           'additionalProperties': {'type': 'string',
+                                                    'description': 'sha256 '
+                                                                   'hex'}}}}
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'ArtifactManifest', 'type': 'object', 'required': ['manifest_version', 'run_id', 'timestamp_utc', 'lane', 'inputs', 'candidate', 'outputs'], 'anyOf': [{'required': ['hashes_file']}, {'required': ['hashes']}], 'properties': {'manifest_version': {'type': 'string'}, 'run_id': {'type': 'string'}, 'timestamp_utc': {'type': 'string'}, 'lane': {'type': 'string'}, 'inputs': {'type': 'object', 'required': ['bench_suite', 'case_id'], 'properties': {'bench_suite': {'type': 'string'}, 'case_id': {'type': 'string'}}}, 'candidate': {'type': 'object', 'required': ['executor', 'genome', 'commandline'], 'properties': {'executor': {'type': 'string'}, 'genome': {'type': 'object'}, 'commandline': {'type': 'array', 'items': {'type': 'string'}}}}, 'outputs': {'type': 'object', 'required': ['result', 'stdout_path', 'stderr_path'], 'properties': {'result': {'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, 'stdout_path': {'type': 'string'}, 'stderr_path': {'type': 'string'}, 'proof_path': {'type': 'string'}}}, 'hashes_file': {'type': 'string', 'description': 'bundle-relative path of a JSON object mapping file paths to sha256 hex'}, 'hashes': {'type': 'object', 'additionalProperties': {'type': 'string', 'description': 'sha256 hex'}}}}, rule='type')
+    data_any_of_count1 = 0
+    if not data_any_of_count1:
+        try:
+            data_is_dict = isinstance(data, dict)
+            if data_is_dict:
+                data__missing_keys = set(['hashes_file']) - data.keys()
+                if data__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['hashes_file']}, rule='required')
+            data_any_of_count1 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if not data_any_of_count1:
+        try:
+            data_is_dict = isinstance(data, dict)
+            if data_is_dict:
+                data__missing_keys = set(['hashes']) - data.keys()
+                if data__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['hashes']}, rule='required')
+            data_any_of_count1 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if not data_any_of_count1:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " cannot be validated by any definition", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'ArtifactManifest', 'type': 'object', 'required': ['manifest_version', 'run_id', 'timestamp_utc', 'lane', 'inputs', 'candidate', 'outputs'], 'anyOf': [{'required': ['hashes_file']}, {'required': ['hashes']}], 'properties': {'manifest_version': {'type': 'string'}, 'run_id': {'type': 'string'}, 'timestamp_utc': {'type': 'string'}, 'lane': {'type': 'string'}, 'inputs': {'type': 'object', 'required': ['bench_suite', 'case_id'], 'properties': {'bench_suite': {'type': 'string'}, 'case_id': {'type': 'string'}}}, 'candidate': {'type': 'object', 'required': ['executor', 'genome', 'commandline'], 'properties': {'executor': {'type': 'string'}, 'genome': {'type': 'object'}, 'commandline': {'type': 'array', 'items': {'type': 'string'}}}}, 'outputs': {'type': 'object', 'required': ['result', 'stdout_path', 'stderr_path'], 'properties': {'result': {'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, 'stdout_path': {'type': 'string'}, 'stderr_path': {'type': 'string'}, 'proof_path': {'type': 'string'}}}, 'hashes_file': {'type': 'string', 'description': 'bundle-relative path of a JSON object mapping file paths to sha256 hex'}, 'hashes': {'type': 'object', 'additionalProperties': {'type': 'string', 'description': 'sha256 hex'}}}}, rule='anyOf')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['manifest_version', 'run_id', 'timestamp_utc', 'lane', 'inputs', 'candidate', 'outputs']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'https://json-schema.org/draft/2020-12/schema', 'title': 'ArtifactManifest', 'type': 'object', 'required': ['manifest_version', 'run_id', 'timestamp_utc', 'lane', 'inputs', 'candidate', 'outputs'], 'anyOf': [{'required': ['hashes_file']}, {'required': ['hashes']}], 'properties': {'manifest_version': {'type': 'string'}, 'run_id': {'type': 'string'}, 'timestamp_utc': {'type': 'string'}, 'lane': {'type': 'string'}, 'inputs': {'type': 'object', 'required': ['bench_suite', 'case_id'], 'properties': {'bench_suite': {'type': 'string'}, 'case_id': {'type': 'string'}}}, 'candidate': {'type': 'object', 'required': ['executor', 'genome', 'commandline'], 'properties': {'executor': {'type': 'string'}, 'genome': {'type': 'object'}, 'commandline': {'type': 'array', 'items': {'type': 'string'}}}}, 'outputs': {'type': 'object', 'required': ['result', 'stdout_path', 'stderr_path'], 'properties': {'result': {'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, 'stdout_path': {'type': 'string'}, 'stderr_path': {'type': 'string'}, 'proof_path': {'type': 'string'}}}, 'hashes_file': {'type': 'string', 'description': 'bundle-relative path of a JSON object mapping file paths to sha256 hex'}, 'hashes': {'type': 'object', 'additionalProperties': {'type': 'string', 'description': 'sha256 hex'}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "manifest_version" in data_keys:
+            data_keys.remove("manifest_version")
+            data__manifestversion = data["manifest_version"]
+            if not isinstance(data__manifestversion, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".manifest_version must be string", value=data__manifestversion, name="" + (name_prefix or "data") + ".manifest_version", definition={'type': 'string'}, rule='type')
+        if "run_id" in data_keys:
+            data_keys.remove("run_id")
+            data__runid = data["run_id"]
+            if not isinstance(data__runid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".run_id must be string", value=data__runid, name="" + (name_prefix or "data") + ".run_id", definition={'type': 'string'}, rule='type')
+        if "timestamp_utc" in data_keys:
+            data_keys.remove("timestamp_utc")
+            data__timestamputc = data["timestamp_utc"]
+            if not isinstance(data__timestamputc, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".timestamp_utc must be string", value=data__timestamputc, name="" + (name_prefix or "data") + ".timestamp_utc", definition={'type': 'string'}, rule='type')
+        if "lane" in data_keys:
+            data_keys.remove("lane")
+            data__lane = data["lane"]
+            if not isinstance(data__lane, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".lane must be string", value=data__lane, name="" + (name_prefix or "data") + ".lane", definition={'type': 'string'}, rule='type')
+        if "inputs" in data_keys:
+            data_keys.remove("inputs")
+            data__inputs = data["inputs"]
+            if not isinstance(data__inputs, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs must be object", value=data__inputs, name="" + (name_prefix or "data") + ".inputs", definition={'type': 'object', 'required': ['bench_suite', 'case_id'], 'properties': {'bench_suite': {'type': 'string'}, 'case_id': {'type': 'string'}}}, rule='type')
+            data__inputs_is_dict = isinstance(data__inputs, dict)
+            if data__inputs_is_dict:
+                data__inputs__missing_keys = set(['bench_suite', 'case_id']) - data__inputs.keys()
+                if data__inputs__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs must contain " + (str(sorted(data__inputs__missing_keys)) + " properties"), value=data__inputs, name="" + (name_prefix or "data") + ".inputs", definition={'type': 'object', 'required': ['bench_suite', 'case_id'], 'properties': {'bench_suite': {'type': 'string'}, 'case_id': {'type': 'string'}}}, rule='required')
+                data__inputs_keys = set(data__inputs.keys())
+                if "bench_suite" in data__inputs_keys:
+                    data__inputs_keys.remove("bench_suite")
+                    data__inputs__benchsuite = data__inputs["bench_suite"]
+                    if not isinstance(data__inputs__benchsuite, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.bench_suite must be string", value=data__inputs__benchsuite, name="" + (name_prefix or "data") + ".inputs.bench_suite", definition={'type': 'string'}, rule='type')
+                if "case_id" in data__inputs_keys:
+                    data__inputs_keys.remove("case_id")
+                    data__inputs__caseid = data__inputs["case_id"]
+                    if not isinstance(data__inputs__caseid, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".inputs.case_id must be string", value=data__inputs__caseid, name="" + (name_prefix or "data") + ".inputs.case_id", definition={'type': 'string'}, rule='type')
+        if "candidate" in data_keys:
+            data_keys.remove("candidate")
+            data__candidate = data["candidate"]
+            if not isinstance(data__candidate, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".candidate must be object", value=data__candidate, name="" + (name_prefix or "data") + ".candidate", definition={'type': 'object', 'required': ['executor', 'genome', 'commandline'], 'properties': {'executor': {'type': 'string'}, 'genome': {'type': 'object'}, 'commandline': {'type': 'array', 'items': {'type': 'string'}}}}, rule='type')
+            data__candidate_is_dict = isinstance(data__candidate, dict)
+            if data__candidate_is_dict:
+                data__candidate__missing_keys = set(['executor', 'genome', 'commandline']) - data__candidate.keys()
+                if data__candidate__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".candidate must contain " + (str(sorted(data__candidate__missing_keys)) + " properties"), value=data__candidate, name="" + (name_prefix or "data") + ".candidate", definition={'type': 'object', 'required': ['executor', 'genome', 'commandline'], 'properties': {'executor': {'type': 'string'}, 'genome': {'type': 'object'}, 'commandline': {'type': 'array', 'items': {'type': 'string'}}}}, rule='required')
+                data__candidate_keys = set(data__candidate.keys())
+                if "executor" in data__candidate_keys:
+                    data__candidate_keys.remove("executor")
+                    data__candidate__executor = data__candidate["executor"]
+                    if not isinstance(data__candidate__executor, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".candidate.executor must be string", value=data__candidate__executor, name="" + (name_prefix or "data") + ".candidate.executor", definition={'type': 'string'}, rule='type')
+                if "genome" in data__candidate_keys:
+                    data__candidate_keys.remove("genome")
+                    data__candidate__genome = data__candidate["genome"]
+                    if not isinstance(data__candidate__genome, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".candidate.genome must be object", value=data__candidate__genome, name="" + (name_prefix or "data") + ".candidate.genome", definition={'type': 'object'}, rule='type')
+                if "commandline" in data__candidate_keys:
+                    data__candidate_keys.remove("commandline")
+                    data__candidate__commandline = data__candidate["commandline"]
+                    if not isinstance(data__candidate__commandline, (list, tuple)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".candidate.commandline must be array", value=data__candidate__commandline, name="" + (name_prefix or "data") + ".candidate.commandline", definition={'type': 'array', 'items': {'type': 'string'}}, rule='type')
+                    data__candidate__commandline_is_list = isinstance(data__candidate__commandline, (list, tuple))
+                    if data__candidate__commandline_is_list:
+                        data__candidate__commandline_len = len(data__candidate__commandline)
+                        for data__candidate__commandline_x, data__candidate__commandline_item in enumerate(data__candidate__commandline):
+                            if not isinstance(data__candidate__commandline_item, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".candidate.commandline[{data__candidate__commandline_x}]".format(**locals()) + " must be string", value=data__candidate__commandline_item, name="" + (name_prefix or "data") + ".candidate.commandline[{data__candidate__commandline_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "outputs" in data_keys:
+            data_keys.remove("outputs")
+            data__outputs = data["outputs"]
+            if not isinstance(data__outputs, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs must be object", value=data__outputs, name="" + (name_prefix or "data") + ".outputs", definition={'type': 'object', 'required': ['result', 'stdout_path', 'stderr_path'], 'properties': {'result': {'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, 'stdout_path': {'type': 'string'}, 'stderr_path': {'type': 'string'}, 'proof_path': {'type': 'string'}}}, rule='type')
+            data__outputs_is_dict = isinstance(data__outputs, dict)
+            if data__outputs_is_dict:
+                data__outputs__missing_keys = set(['result', 'stdout_path', 'stderr_path']) - data__outputs.keys()
+                if data__outputs__missing_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs must contain " + (str(sorted(data__outputs__missing_keys)) + " properties"), value=data__outputs, name="" + (name_prefix or "data") + ".outputs", definition={'type': 'object', 'required': ['result', 'stdout_path', 'stderr_path'], 'properties': {'result': {'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, 'stdout_path': {'type': 'string'}, 'stderr_path': {'type': 'string'}, 'proof_path': {'type': 'string'}}}, rule='required')
+                data__outputs_keys = set(data__outputs.keys())
+                if "result" in data__outputs_keys:
+                    data__outputs_keys.remove("result")
+                    data__outputs__result = data__outputs["result"]
+                    if not isinstance(data__outputs__result, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs.result must be string", value=data__outputs__result, name="" + (name_prefix or "data") + ".outputs.result", definition={'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, rule='type')
+                    if not (isinstance(data__outputs__result, str) and data__outputs__result == 'SAT' or isinstance(data__outputs__result, str) and data__outputs__result == 'UNSAT' or isinstance(data__outputs__result, str) and data__outputs__result == 'UNKNOWN' or isinstance(data__outputs__result, str) and data__outputs__result == 'ERROR' or isinstance(data__outputs__result, str) and data__outputs__result == 'TIMEOUT'):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs.result must be one of ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']", value=data__outputs__result, name="" + (name_prefix or "data") + ".outputs.result", definition={'type': 'string', 'enum': ['SAT', 'UNSAT', 'UNKNOWN', 'ERROR', 'TIMEOUT']}, rule='enum')
+                if "stdout_path" in data__outputs_keys:
+                    data__outputs_keys.remove("stdout_path")
+                    data__outputs__stdoutpath = data__outputs["stdout_path"]
+                    if not isinstance(data__outputs__stdoutpath, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs.stdout_path must be string", value=data__outputs__stdoutpath, name="" + (name_prefix or "data") + ".outputs.stdout_path", definition={'type': 'string'}, rule='type')
+                if "stderr_path" in data__outputs_keys:
+                    data__outputs_keys.remove("stderr_path")
+                    data__outputs__stderrpath = data__outputs["stderr_path"]
+                    if not isinstance(data__outputs__stderrpath, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs.stderr_path must be string", value=data__outputs__stderrpath, name="" + (name_prefix or "data") + ".outputs.stderr_path", definition={'type': 'string'}, rule='type')
+                if "proof_path" in data__outputs_keys:
+                    data__outputs_keys.remove("proof_path")
+                    data__outputs__proofpath = data__outputs["proof_path"]
+                    if not isinstance(data__outputs__proofpath, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".outputs.proof_path must be string", value=data__outputs__proofpath, name="" + (name_prefix or "data") + ".outputs.proof_path", definition={'type': 'string'}, rule='type')
+        if "hashes_file" in data_keys:
+            data_keys.remove("hashes_file")
+            data__hashesfile = data["hashes_file"]
+            if not isinstance(data__hashesfile, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".hashes_file must be string", value=data__hashesfile, name="" + (name_prefix or "data") + ".hashes_file", definition={'type': 'string', 'description': 'bundle-relative path of a JSON object mapping file paths to sha256 hex'}, rule='type')
+        if "hashes" in data_keys:
+            data_keys.remove("hashes")
+            data__hashes = data["hashes"]
+            if not isinstance(data__hashes, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".hashes must be object", value=data__hashes, name="" + (name_prefix or "data") + ".hashes", definition={'type': 'object', 'additionalProperties': {'type': 'string', 'description': 'sha256 hex'}}, rule='type')
+            data__hashes_is_dict = isinstance(data__hashes, dict)
+            if data__hashes_is_dict:
+                data__hashes_keys = set(data__hashes.keys())
+                for data__hashes_key in data__hashes_keys:
+                    if data__hashes_key not in []:
+                        data__hashes_value = data__hashes.get(data__hashes_key)
+                        if not isinstance(data__hashes_value, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".hashes.{data__hashes_key}".format(**locals()) + " must be string", value=data__hashes_value, name="" + (name_prefix or "data") + ".hashes.{data__hashes_key}".format(**locals()) + "", definition={'type': 'string', 'description': 'sha256 hex'}, rule='type')
+    return data
\ No newline at end of file
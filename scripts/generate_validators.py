@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Regenerate the precompiled contract validators in omniforge/contracts/.
+
+Each schema is compiled with fastjsonschema.compile_to_code and written out as a
+self-contained module (schema embedded as a Python literal), so the CLI never
+parses or compiles a schema at runtime.
+
+fastjsonschema compiles the schemas under Draft 7 rules and silently ignores
+keywords it does not know, so schemas using anything outside Draft 7 (e.g.
+prefixItems, dependentRequired) are rejected here rather than half-enforced.
+
+Usage: generate_validators.py [--check]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pprint
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+CONTRACTS_DIR = Path(__file__).resolve().parent.parent / "omniforge" / "contracts"
+
+TARGETS = {
+    "artifact_manifest.schema.json": "_manifest_validator.py",
+    "eval_contract.schema.json": "_eval_validator.py",
+}
+
+DRAFT7_KEYWORDS = frozenset({
+    "$schema", "$id", "$ref", "$comment", "title", "description", "default", "examples",
+    "readOnly", "writeOnly", "type", "enum", "const", "multipleOf", "maximum",
+    "exclusiveMaximum", "minimum", "exclusiveMinimum", "maxLength", "minLength", "pattern",
+    "format", "contentMediaType", "contentEncoding", "items", "additionalItems", "maxItems",
+    "minItems", "uniqueItems", "contains", "maxProperties", "minProperties", "required",
+    "properties", "patternProperties", "additionalProperties", "dependencies",
+    "propertyNames", "if", "then", "else", "allOf", "anyOf", "oneOf", "not", "definitions",
+})
+_SUBSCHEMA = ("additionalItems", "additionalProperties", "contains", "propertyNames", "if", "then", "else", "not")
+_SUBSCHEMA_MAP = ("properties", "patternProperties", "definitions")
+_SUBSCHEMA_LIST = ("allOf", "anyOf", "oneOf")
+
+
+def unsupported_keywords(schema: object, where: str = "#") -> list[str]:
+    """Return JSON pointers of keywords fastjsonschema would not enforce."""
+    if not isinstance(schema, dict):
+        return []  # boolean schema
+    found = [f"{where}/{k}" for k in schema if k not in DRAFT7_KEYWORDS]
+    for k in _SUBSCHEMA:
+        if k in schema:
+            found += unsupported_keywords(schema[k], f"{where}/{k}")
+    for k in _SUBSCHEMA_MAP:
+        for name, sub in schema.get(k, {}).items():
+            found += unsupported_keywords(sub, f"{where}/{k}/{name}")
+    for k in _SUBSCHEMA_LIST:
+        for i, sub in enumerate(schema.get(k, [])):
+            found += unsupported_keywords(sub, f"{where}/{k}/{i}")
+    items = schema.get("items")
+    if isinstance(items, list):
+        for i, sub in enumerate(items):
+            found += unsupported_keywords(sub, f"{where}/items/{i}")
+    elif items is not None:
+        found += unsupported_keywords(items, f"{where}/items")
+    for name, dep in schema.get("dependencies", {}).items():
+        if isinstance(dep, dict):
+            found += unsupported_keywords(dep, f"{where}/dependencies/{name}")
+    return found
+
+
+def render(schema_name: str) -> str:
+    schema = json.loads((CONTRACTS_DIR / schema_name).read_text(encoding="utf-8"))
+    unsupported = unsupported_keywords(schema)
+    if unsupported:
+        raise SystemExit(f"{schema_name}: keywords not enforced by fastjsonschema: " + ", ".join(unsupported))
+    code = fastjsonschema.compile_to_code(schema)
+    return (
+        f"# Generated by scripts/generate_validators.py from {schema_name}; do not edit.\n"
+        f"# fmt: off\n"
+        f"SCHEMA = {pprint.pformat(schema, sort_dicts=False)}\n\n"
+        f"{code}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--check", action="store_true", help="Fail if a generated module is out of date")
+    args = p.parse_args(argv)
+
+    stale = []
+    for schema_name, module_name in TARGETS.items():
+        out = CONTRACTS_DIR / module_name
+        text = render(schema_name)
+        if out.exists() and out.read_text(encoding="utf-8") == text:
+            continue
+        if args.check:
+            stale.append(module_name)
+        else:
+            out.write_text(text, encoding="utf-8")
+            print(f"wrote {out}")
+
+    if stale:
+        print("stale generated validators: " + ", ".join(stale), file=sys.stderr)
+        print("run: make generate-validators", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())